@@ -1,5 +1,6 @@
 import os
-from unittest import TestCase
+import tempfile
+from unittest import TestCase, mock
 from pathlib import Path
 import numpy.testing as nt
 
@@ -70,6 +71,13 @@ class TestAPI(TestCase):
 
         nt.assert_equal(uxds_mf_ne30.source_datasets, self.dsfiles_mf_ne30)
 
+        # opening the files in parallel produces the same dataset
+        uxds_mf_ne30_parallel = ux.open_mfdataset(self.gridfile_ne30,
+                                                  self.dsfiles_mf_ne30,
+                                                  parallel=True)
+
+        xr.testing.assert_identical(uxds_mf_ne30, uxds_mf_ne30_parallel)
+
     def test_open_grid(self):
         """Loads only a grid topology file using uxarray's open_grid call."""
         uxgrid = ux.open_grid(self.gridfile_geoflow)
@@ -78,6 +86,71 @@ class TestAPI(TestCase):
                                constants.MESH30_AREA,
                                decimal=3)
 
+    def test_open_grid_memmap(self):
+        """Opens a grid twice with ``memmap=True``, with the second open
+        memory-mapping the arrays cached by the first."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch.dict(os.environ, {"UXARRAY_CACHE_DIR": cache_dir}):
+                uxgrid = ux.open_grid(self.gridfile_ne30, memmap=True)
+                uxgrid_memmap = ux.open_grid(self.gridfile_ne30, memmap=True)
+
+        assert isinstance(uxgrid_memmap.face_node_connectivity.values.base, np.memmap)
+        assert uxgrid_memmap.source_grid_spec == uxgrid.source_grid_spec
+        assert uxgrid_memmap._source_dims_dict == uxgrid._source_dims_dict
+
+        nt.assert_array_equal(uxgrid_memmap.node_lon.values, uxgrid.node_lon.values)
+        nt.assert_array_equal(uxgrid_memmap.face_node_connectivity.values,
+                              uxgrid.face_node_connectivity.values)
+        nt.assert_almost_equal(uxgrid_memmap.calculate_total_face_area(),
+                               uxgrid.calculate_total_face_area())
+
+    def test_open_grid_memmap_fallback(self):
+        """Opens a grid with ``memmap=True`` when the cache can't be written or
+        contains a corrupt entry, which should fall back to reading the file,
+        and checks that stale entries for the same file are replaced."""
+        uxgrid = ux.open_grid(self.gridfile_ne30)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # cache directory nested under a file can't be created
+            not_a_dir = os.path.join(tmp_dir, "file")
+            open(not_a_dir, "w").close()
+            with mock.patch.dict(os.environ, {"UXARRAY_CACHE_DIR": os.path.join(not_a_dir, "sub")}):
+                uxgrid_unwritable = ux.open_grid(self.gridfile_ne30, memmap=True)
+
+            cache_dir = os.path.join(tmp_dir, "cache")
+            with mock.patch.dict(os.environ, {"UXARRAY_CACHE_DIR": cache_dir}):
+                ux.open_grid(self.gridfile_ne30, memmap=True)
+
+                # corrupt the index of the cached entry, which is rewritten by the next open
+                file_dir = os.path.join(cache_dir, "grids", os.listdir(os.path.join(cache_dir, "grids"))[0])
+                cached_entries = os.listdir(file_dir)
+                assert len(cached_entries) == 1
+                with open(os.path.join(file_dir, cached_entries[0], "index.json"), "w") as f:
+                    f.write("{")
+
+                uxgrid_corrupt = ux.open_grid(self.gridfile_ne30, memmap=True)
+                uxgrid_rewritten = ux.open_grid(self.gridfile_ne30, memmap=True)
+                assert isinstance(uxgrid_rewritten.face_node_connectivity.values.base, np.memmap)
+
+                # a different version of uxarray replaces the entry for the same file
+                with mock.patch("uxarray.__version__", "0.0.0"):
+                    ux.open_grid(self.gridfile_ne30, memmap=True)
+                assert len(os.listdir(file_dir)) == 1
+                assert os.listdir(file_dir) != cached_entries
+
+        for uxgrid_fallback in (uxgrid_unwritable, uxgrid_corrupt):
+            nt.assert_array_equal(uxgrid_fallback.face_node_connectivity.values,
+                                  uxgrid.face_node_connectivity.values)
+
+    def test_open_grid_shapefile(self):
+        """Opens a shapefile, which is rejected without attempting to open it
+        with xarray."""
+        gridfile_shp = current_path / "meshfiles" / "shp" / "grid_fire.shp"
+
+        with mock.patch("xarray.open_dataset", side_effect=AssertionError):
+            with self.assertRaises(ValueError):
+                ux.open_grid(gridfile_shp)
+
     def test_copy_dataset(self):
         """Loads a single dataset with its grid topology file using uxarray's
         open_dataset call and make a copy of the object."""
@@ -99,6 +99,54 @@ class TestGeometryConversions(TestCase):
 
         assert len(pc_geoflow_data._paths) == len(corrected_polygon_shells)
 
+    def test_polygon_shells(self):
+        """Tests that each polygon shell contains the (lon, lat) of its face
+        nodes, closed by repeating the first node."""
+        faces_verts = [[[150, 10], [160, 20], [150, 30], [135, 30]],
+                       [[125, 20], [135, 30], [125, 60],
+                        [ux.INT_FILL_VALUE, ux.INT_FILL_VALUE]]]
+        uxgrid = ux.open_grid(faces_verts, latlon=True)
+
+        polygon_shells = _build_polygon_shells(
+            uxgrid.node_lon.values, uxgrid.node_lat.values,
+            uxgrid.face_node_connectivity.values, uxgrid.n_face,
+            uxgrid.n_max_face_nodes, uxgrid.n_nodes_per_face.values)
+
+        assert polygon_shells.shape == (2, 5, 2)
+
+        expected_quad = faces_verts[0] + [faces_verts[0][0]]
+        expected_tri = faces_verts[1][:3] + [faces_verts[1][0]] * 2
+        np.testing.assert_array_equal(polygon_shells[0], expected_quad)
+        np.testing.assert_array_equal(polygon_shells[1], expected_tri)
+
+    def test_corrected_polygon_shells(self):
+        """Tests that only polygon shells that cross the antimeridian are
+        split."""
+        faces_verts = [[[150, 10], [160, 20], [150, 30], [135, 30]],
+                       [[-170, 40], [180, 30], [165, 25], [-170, 20]]]
+        uxgrid = ux.open_grid(faces_verts, latlon=True)
+
+        polygon_shells = _build_polygon_shells(
+            uxgrid.node_lon.values, uxgrid.node_lat.values,
+            uxgrid.face_node_connectivity.values, uxgrid.n_face,
+            uxgrid.n_max_face_nodes, uxgrid.n_nodes_per_face.values)
+
+        corrected_polygon_shells, corrected_to_original_faces = _build_corrected_polygon_shells(
+            polygon_shells)
+
+        # second face is split across the antimeridian
+        np.testing.assert_array_equal(corrected_to_original_faces, [0, 1, 1])
+        np.testing.assert_array_equal(corrected_polygon_shells[0],
+                                      polygon_shells[0])
+
+        # without any antimeridian faces, the shells are used directly
+        corrected_polygon_shells, corrected_to_original_faces = _build_corrected_polygon_shells(
+            polygon_shells[:1])
+
+        np.testing.assert_array_equal(corrected_to_original_faces, [0])
+        np.testing.assert_array_equal(corrected_polygon_shells,
+                                      polygon_shells[:1])
+
     def test_geodataframe_caching(self):
         uxds = ux.open_dataset(gridfile_ne30, dsfile_var2_ne30)
 
@@ -10,7 +10,8 @@ import uxarray as ux
 
 from uxarray.grid.connectivity import _populate_face_edge_connectivity, _build_edge_face_connectivity, _build_edge_node_connectivity
 
-from uxarray.grid.coordinates import _populate_lonlat_coord, node_lonlat_rad_to_xyz
+from uxarray.grid.coordinates import _populate_lonlat_coord, node_lonlat_rad_to_xyz, node_xyz_to_lonlat_rad, \
+    _get_xyz_from_lonlat, _get_lonlat_from_xyz
 
 from uxarray.constants import INT_FILL_VALUE, ERROR_TOLERANCE
 
@@ -221,6 +222,16 @@ class TestGrid(TestCase):
         assert (vgrid.n_face == 3)
         assert (vgrid.n_node == 12)
 
+        # fill values are preserved and every remaining index maps back to its vertex
+        face_nodes = vgrid.face_node_connectivity.values
+        verts = np.array(faces_verts_filled_values)
+        fill_mask = verts[:, :, 0] == ux.INT_FILL_VALUE
+        nt.assert_array_equal(face_nodes == INT_FILL_VALUE, fill_mask)
+        nt.assert_array_equal(vgrid.node_x.values[face_nodes[~fill_mask]],
+                              verts[~fill_mask][:, 0])
+        nt.assert_array_equal(vgrid.node_y.values[face_nodes[~fill_mask]],
+                              verts[~fill_mask][:, 1])
+
     def test_grid_properties(self):
         """Tests to see if accessing variables through set properties is equal
         to using the dict."""
@@ -274,6 +285,39 @@ class TestGrid(TestCase):
         pass
 
 
+class TestMortonReorder(TestCase):
+
+    def test_morton_reorder(self):
+        """Reorders the nodes and faces of a grid along a Morton curve and
+        checks that each face still references the same node coordinates."""
+        uxgrid = ux.open_grid(gridfile_RLL1deg)
+        reordered = uxgrid._morton_reorder()
+
+        node_indices = reordered._ds["original_node_indices"].values
+        face_indices = reordered._ds["original_face_indices"].values
+
+        # both orderings are permutations of the original elements
+        nt.assert_array_equal(np.sort(node_indices), np.arange(uxgrid.n_node))
+        nt.assert_array_equal(np.sort(face_indices), np.arange(uxgrid.n_face))
+
+        nt.assert_array_equal(reordered.node_lon.values,
+                              uxgrid.node_lon.values[node_indices])
+
+        face_nodes = uxgrid.face_node_connectivity.values[face_indices]
+        reordered_face_nodes = reordered.face_node_connectivity.values
+        valid = reordered_face_nodes != INT_FILL_VALUE
+
+        nt.assert_array_equal(valid, face_nodes != INT_FILL_VALUE)
+        nt.assert_array_equal(node_indices[reordered_face_nodes[valid]],
+                              face_nodes[valid])
+
+        nt.assert_almost_equal(reordered.calculate_total_face_area(),
+                               uxgrid.calculate_total_face_area())
+
+        assert reordered.source_grid_spec == uxgrid.source_grid_spec
+        assert reordered._source_dims_dict == uxgrid._source_dims_dict
+
+
 class TestOperators(TestCase):
     grid_CSne30_01 = ux.open_grid(gridfile_CSne30)
     grid_CSne30_02 = ux.open_grid(gridfile_CSne30)
@@ -471,6 +515,26 @@ class TestPopulateCoordinates(TestCase):
                                    decimal=12)
 
 
+    def test_vectorized_coordinate_conversion(self):
+        """Converts whole coordinate arrays at once and compares against the
+        per-node conversion functions, including nodes at the poles."""
+        lon_deg = np.array([0.0, 45.0, -120.0, 179.0, 10.0, 10.0])
+        lat_deg = np.array([0.0, 35.0, -60.0, 89.0, 90.0, -90.0])
+
+        x, y, z = _get_xyz_from_lonlat(lon_deg, lat_deg)
+        lon_res, lat_res = _get_lonlat_from_xyz(x, y, z)
+
+        for i in range(lon_deg.size):
+            expected_xyz = node_lonlat_rad_to_xyz(
+                [np.deg2rad(lon_deg[i]), np.deg2rad(lat_deg[i])])
+            nt.assert_almost_equal([x[i], y[i], z[i]], expected_xyz, decimal=12)
+
+            expected_lonlat = np.rad2deg(
+                node_xyz_to_lonlat_rad([x[i], y[i], z[i]]))
+            nt.assert_almost_equal([lon_res[i], lat_res[i]], expected_lonlat,
+                                   decimal=10)
+
+
 class TestConnectivity(TestCase):
     mpas_filepath = current_path / "meshfiles" / "mpas" / "QU" / "mesh.QU.1920km.151026.nc"
     exodus_filepath = current_path / "meshfiles" / "exodus" / "outCSne8" / "outCSne8.g"
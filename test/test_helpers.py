@@ -200,24 +200,29 @@ class TestConstants(TestCase):
 
 class TestSparseMatrix(TestCase):
 
-    def test_convert_face_node_conn_to_sparse_matrix(self):
-        """Tests _face_nodes_to_sparse_matrix() helper function to see if can
-        generate sparse matrix from face_nodes_conn that has Fill Values."""
+    def test_face_node_csr(self):
+        """Tests _build_face_node_csr() helper function to see if it drops
+        Fill Values and offsets each face correctly."""
         face_nodes_conn = np.array([[3, 4, 5, INT_FILL_VALUE], [3, 0, 2, 5],
                                     [3, 4, 1, 0], [0, 1, 2, INT_FILL_VALUE]])
 
-        face_indices, nodes_indices, non_zero_flag = ux.grid.connectivity._face_nodes_to_sparse_matrix(
+        indptr, indices = ux.grid.connectivity._build_face_node_csr(
             face_nodes_conn)
-        expected_non_zero_flag = np.array(
-            [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1])
-        expected_face_indices = np.array(
-            [0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3])
-        expected_nodes_indices = np.array(
-            [3, 4, 5, 3, 0, 2, 5, 3, 4, 1, 0, 0, 1, 2])
-
-        nt.assert_array_equal(non_zero_flag, expected_non_zero_flag)
-        nt.assert_array_equal(face_indices, expected_face_indices)
-        nt.assert_array_equal(nodes_indices, expected_nodes_indices)
+
+        nt.assert_array_equal(indptr, [0, 3, 7, 11, 14])
+        nt.assert_array_equal(indices,
+                              [3, 4, 5, 3, 0, 2, 5, 3, 4, 1, 0, 0, 1, 2])
+
+        node_faces, n_max_faces_per_node = ux.grid.connectivity._build_node_faces_connectivity(
+            face_nodes_conn, 6)
+
+        expected_node_faces = np.array([[1, 2, 3], [2, 3, INT_FILL_VALUE],
+                                        [1, 3, INT_FILL_VALUE],
+                                        [0, 1, 2], [0, 2, INT_FILL_VALUE],
+                                        [0, 1, INT_FILL_VALUE]])
+
+        assert n_max_faces_per_node == 3
+        nt.assert_array_equal(node_faces, expected_node_faces)
 
 
 class TestOperators(TestCase):
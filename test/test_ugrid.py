@@ -20,6 +20,8 @@ gridfile_ne30 = current_path / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30.
 gridfile_RLL1deg = current_path / "meshfiles" / "ugrid" / "outRLL1deg" / "outRLL1deg.ug"
 gridfile_RLL10deg_ne4 = current_path / "meshfiles" / "ugrid" / "ov_RLL10deg_CSne4" / "ov_RLL10deg_CSne4.ug"
 
+gridfile_fesom = current_path / "meshfiles" / "ugrid" / "fesom" / "fesom.mesh.diag.nc"
+gridfile_quad_hex = current_path / "meshfiles" / "ugrid" / "quad-hexagon" / "grid.nc"
 gridfile_exo_ne8 = current_path / "meshfiles" / "exodus" / "outCSne8" / "outCSne8.g"
 
 
@@ -58,6 +60,60 @@ class TestUgrid(TestCase):
             assert isinstance(getattr(uxgrid_url, "face_node_connectivity"),
                               xr.DataArray)
 
+    def test_is_ugrid(self):
+        """Detects the UGRID mesh topology from variable attributes."""
+        from uxarray.io._ugrid import _is_ugrid
+
+        assert _is_ugrid(xr.open_dataset(gridfile_ne30))
+        assert not _is_ugrid(xr.open_dataset(gridfile_exo_ne8))
+
+        # mesh topology without face node connectivity is not a valid ugrid
+        ds = xr.open_dataset(gridfile_ne30)
+        ds["Mesh2"].attrs.pop("face_node_connectivity")
+        assert not _is_ugrid(ds)
+
+    def test_read_ugrid_topology_attrs(self):
+        """Reads grids using the coordinate and dimension names given by the
+        mesh topology attributes."""
+        # edge and face coordinates with non-standard names given by the topology
+        ds = xr.open_dataset(gridfile_quad_hex)
+        ds = ds.rename({"edge_lon": "mesh_edge_x", "edge_lat": "mesh_edge_y",
+                        "face_lon": "mesh_face_x", "face_lat": "mesh_face_y"})
+        ds["topology"].attrs["edge_coordinates"] = "mesh_edge_x mesh_edge_y"
+        ds["topology"].attrs["face_coordinates"] = "mesh_face_x mesh_face_y"
+
+        uxgrid_quad_hex = ux.Grid.from_dataset(ds)
+
+        nt.assert_array_equal(uxgrid_quad_hex._ds["edge_lon"].values, ds["mesh_edge_x"].values)
+        nt.assert_array_equal(uxgrid_quad_hex._ds["edge_lat"].values, ds["mesh_edge_y"].values)
+        nt.assert_array_equal(uxgrid_quad_hex._ds["face_lon"].values, ds["mesh_face_x"].values)
+        nt.assert_array_equal(uxgrid_quad_hex._ds["face_lat"].values, ds["mesh_face_y"].values)
+        assert uxgrid_quad_hex._ds["face_lon"].dims == ("n_face",)
+        assert uxgrid_quad_hex._ds["edge_lon"].dims == ("n_edge",)
+
+        # connectivity stored with the element dimension last
+        ds = xr.open_dataset(gridfile_fesom)
+        uxgrid_fesom = ux.open_grid(gridfile_fesom)
+
+        assert uxgrid_fesom.n_face == ds.sizes["elem"]
+        assert uxgrid_fesom.n_edge == ds.sizes["edg_n"]
+        assert uxgrid_fesom.n_max_face_nodes == ds.sizes["n3"]
+        assert uxgrid_fesom.face_node_connectivity.dims == ("n_face", "n_max_face_nodes")
+
+    def test_read_ugrid_missing_topology_dims(self):
+        """Reads a grid whose mesh topology declares dimensions that aren't
+        present in the dataset, which are inferred from the variables
+        instead."""
+        ds = xr.open_dataset(gridfile_ne30)
+        ds["Mesh2"].attrs["edge_dimension"] = "nMesh2_edge"
+        ds["Mesh2"].attrs["face_dimension"] = "nMesh2_face_missing"
+
+        uxgrid = ux.Grid.from_dataset(ds)
+
+        assert uxgrid.n_face == ds.sizes["nMesh2_face"]
+        assert uxgrid.n_node == ds.sizes["nMesh2_node"]
+        assert uxgrid.face_node_connectivity.dims == ("n_face", "n_max_face_nodes")
+
     def test_encode_ugrid(self):
         """Read an Exodus dataset and encode that as a UGRID format."""
 
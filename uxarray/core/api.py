@@ -9,6 +9,8 @@ from typing import Any, Dict, Optional, Union
 from uxarray.grid import Grid
 from uxarray.core.dataset import UxDataset
 from uxarray.core.utils import _map_dims_to_ugrid
+from uxarray.io._cache import _file_key, _read_memmap_grid, _write_memmap_grid
+from uxarray.io.utils import _is_shapefile
 
 from warnings import warn
 
@@ -19,6 +21,7 @@ def open_grid(
     ],
     latlon: Optional[bool] = False,
     use_dual: Optional[bool] = False,
+    memmap: Optional[bool] = False,
     **kwargs: Dict[str, Any],
 ) -> Grid:
     """Constructs and returns an ``uxarray.Grid`` object from a grid topology
@@ -40,6 +43,15 @@ def open_grid(
     use_dual: bool, optional
         Specify whether to use the primal (use_dual=False) or dual (use_dual=True) mesh if the file type is mpas
 
+    memmap: bool, optional
+        If True and ``grid_filename_or_obj`` is a local file, the standardized grid variables are cached as ``.npy``
+        files under the uxarray cache directory (``~/.cache/uxarray`` or ``$UXARRAY_CACHE_DIR``) the first time the
+        file is opened. Subsequent opens of the unmodified file with the same version of uxarray memory-map the
+        cached arrays, skipping ``xarray.open_dataset`` and any decoding entirely. If the cache can't be read or
+        written, the grid is opened from ``grid_filename_or_obj`` as usual. The cache stores a full on-disk copy
+        of the grid, which replaces any copy cached for a previous state of the same file, and can be cleared by
+        deleting the cache directory.
+
     **kwargs : Dict[str, Any]
         Additional arguments passed on to ``xarray.open_dataset``. Refer to the
         [xarray
@@ -82,12 +94,35 @@ def open_grid(
 
     # attempt to use Xarray directly for remaining input types
     else:
-        try:
-            grid_ds = xr.open_dataset(grid_filename_or_obj, **kwargs)
+        if _is_shapefile(grid_filename_or_obj):
+            # shapefiles can't be read by xarray, so avoid probing every backend
+            raise ValueError("Shapefiles not yet supported")
+
+        cache_key = None
+        if memmap:
+            from uxarray import __version__
+
+            # cached grids are only reused by the version of uxarray that wrote them
+            cache_key = _file_key(
+                grid_filename_or_obj,
+                __version__,
+                use_dual,
+                repr(sorted(kwargs.items())),
+            )
+
+        if cache_key is not None:
+            grid_ds, source_grid_spec, source_dims_dict = _read_memmap_grid(cache_key)
+            if grid_ds is not None:
+                return Grid(grid_ds, source_grid_spec, source_dims_dict)
+
+        grid_ds = xr.open_dataset(grid_filename_or_obj, **kwargs)
+
+        uxgrid = Grid.from_dataset(grid_ds, use_dual=use_dual)
 
-            uxgrid = Grid.from_dataset(grid_ds, use_dual=use_dual)
-        except ValueError:
-            raise ValueError("Inputted grid_filename_or_obj not supported.")
+        if cache_key is not None:
+            _write_memmap_grid(
+                cache_key, uxgrid._ds, uxgrid.source_grid_spec, uxgrid._source_dims_dict
+            )
 
     return uxgrid
 
@@ -221,7 +256,9 @@ def open_mfdataset(
         for accepted keyword arguments.
 
     **kwargs : Dict[str, Any]
-        Additional arguments passed on to ``xarray.open_mfdataset``. Refer to the
+        Additional arguments passed on to ``xarray.open_mfdataset``. Passing ``parallel=True`` opens and
+        preprocesses the dataset files in parallel using ``dask.delayed``, which can be faster when there are
+        many files or the files are stored remotely. Refer to the
         [xarray
         docs](https://xarray.pydata.org/en/stable/generated/xarray.open_mfdataset.html)
         for accepted keyword arguments.
@@ -57,15 +57,13 @@ class UxDataArray(xr.DataArray):
     __slots__ = ("_uxgrid",)
 
     def __init__(self, *args, uxgrid: Grid = None, **kwargs):
-        self._uxgrid = None
-
         if uxgrid is not None and not isinstance(uxgrid, Grid):
             raise RuntimeError(
                 "uxarray.UxDataArray.__init__: uxgrid can be either None or "
                 "an instance of the uxarray.Grid class"
             )
-        else:
-            self.uxgrid = uxgrid
+
+        self._uxgrid = uxgrid
 
         super().__init__(*args, **kwargs)
 
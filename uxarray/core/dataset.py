@@ -58,17 +58,14 @@ class UxDataset(xr.Dataset):
         source_datasets: Optional[str] = None,
         **kwargs,
     ):
-        self._uxgrid = None
-        self._source_datasets = source_datasets
-        # setattr(self, 'source_datasets', source_datasets)
-
         if uxgrid is not None and not isinstance(uxgrid, Grid):
             raise RuntimeError(
                 "uxarray.UxDataset.__init__: uxgrid can be either None or "
                 "an instance of the `uxarray.Grid` class"
             )
-        else:
-            self.uxgrid = uxgrid
+
+        self._uxgrid = uxgrid
+        self._source_datasets = source_datasets
 
         super().__init__(*args, **kwargs)
 
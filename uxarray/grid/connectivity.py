@@ -1,8 +1,6 @@
 import numpy as np
 import xarray as xr
 
-from scipy import sparse
-
 from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
 from uxarray.conventions import ugrid
 
@@ -122,6 +120,38 @@ def _replace_fill_values(grid_var, original_fill, new_fill, new_dtype=None):
     return grid_var
 
 
+def _build_index_map(indices, n_elements):
+    """Constructs an array that maps each original element index to its
+    position in (``indices``), with elements that are not present mapped to
+    ``INT_FILL_VALUE``.
+
+    Parameters
+    ----------
+    indices : np.ndarray
+        Original indices of each element in their new order
+    n_elements : int
+        Number of elements before indexing
+
+    Returns
+    ----------
+    index_map : np.ndarray
+        Array of shape [n_elements] containing the new index of each element
+    """
+    index_map = np.full(n_elements, INT_FILL_VALUE, dtype=INT_DTYPE)
+    index_map[indices] = np.arange(len(indices), dtype=INT_DTYPE)
+    return index_map
+
+
+def _remap_connectivity(conn, index_map):
+    """Replaces each non-fill value entry of a connectivity variable with its
+    new index given by (``index_map``), built using ``_build_index_map``."""
+    conn = np.asarray(conn)
+    remapped = np.full(conn.shape, INT_FILL_VALUE, dtype=INT_DTYPE)
+    valid = conn != INT_FILL_VALUE
+    remapped[valid] = index_map[conn[valid]]
+    return remapped
+
+
 def _populate_n_nodes_per_face(grid):
     """Constructs the connectivity variable (``n_nodes_per_face``) and stores
     it within the internal (``Grid._ds``) and through the attribute
@@ -321,93 +351,59 @@ def _build_node_faces_connectivity(face_nodes, n_node):
     (n_node, n_max_faces_per_node) (optional) A DataArray of indices indicating
     faces that are neighboring each node.
 
-    This function converts the face-node connectivity data into a sparse matrix, and then constructs the node-face
-    connectivity by iterating over each node in the mesh and retrieving the set of neighboring faces.
-
-    Raises
-    ------
-    RuntimeError
-        If the Mesh object does not contain a 'face_node_connectivity' variable.
+    This function converts the face-node connectivity into a compressed sparse row layout, and then groups the
+    faces of each (node, face) pair by node, with the faces of each node in ascending order.
     """
-    # First we need to build a matrix such that: the row indices are face indexes and the column indices are node
-    # indexes (similar to an adjacency matrix)
-    face_indices, node_indices, non_filled_element_flags = _face_nodes_to_sparse_matrix(
-        face_nodes
+    indptr, indices = _build_face_node_csr(face_nodes)
+
+    # face index of each entry in ``indices``
+    face_indices = np.repeat(
+        np.arange(len(indptr) - 1, dtype=INT_DTYPE), np.diff(indptr)
     )
-    coo_matrix = sparse.coo_matrix(
-        (non_filled_element_flags, (node_indices, face_indices))
+
+    # sort (node, face) pairs by node, then face, dropping any repeated nodes within a face
+    node_face_pairs = np.unique(indices * (len(indptr) - 1) + face_indices)
+    node_indices = node_face_pairs // (len(indptr) - 1)
+    face_indices = node_face_pairs % (len(indptr) - 1)
+
+    n_faces_per_node = np.bincount(node_indices, minlength=n_node)
+    nMaxNumFacesPerNode = n_faces_per_node.max()
+
+    # position of each face within the row of its node
+    node_start = np.cumsum(n_faces_per_node) - n_faces_per_node
+    position = np.arange(len(node_indices)) - node_start[node_indices]
+
+    node_face_connectivity = np.full(
+        (n_node, nMaxNumFacesPerNode), INT_FILL_VALUE, dtype=INT_DTYPE
     )
-    csr_matrix = coo_matrix.tocsr()
-    # get the row and column indices of the non-zero elements
-    rows, cols = csr_matrix.nonzero()
-    # Find the frequency of each face to determine the maximum number of faces per node
-    freq = np.bincount(rows)
-    nMaxNumFacesPerNode = freq.max()
-
-    node_face_connectivity = [[]] * n_node
-
-    # find the indices where the array changes value
-    change_indices = np.where(np.diff(rows) != 0)[0] + 1
-
-    # split the array at the change indices to get subarrays of consecutive same elements
-    subarrays = np.split(rows, change_indices)
-
-    # get the start and end indices for each subarray
-    start_indices = np.cumsum([0] + [len(subarray) for subarray in subarrays[:-1]])
-    end_indices = np.cumsum([len(subarray) for subarray in subarrays]) - 1
-
-    for node_index in range(n_node):
-        node_face_connectivity[node_index] = cols[
-            start_indices[node_index] : end_indices[node_index] + 1
-        ]
-        if len(node_face_connectivity[node_index]) < nMaxNumFacesPerNode:
-            node_face_connectivity[node_index] = np.append(
-                node_face_connectivity[node_index],
-                np.full(
-                    nMaxNumFacesPerNode - len(node_face_connectivity[node_index]),
-                    INT_FILL_VALUE,
-                    dtype=INT_DTYPE,
-                ),
-            )
+    node_face_connectivity[node_indices, position] = face_indices
 
     return node_face_connectivity, nMaxNumFacesPerNode
 
 
-def _face_nodes_to_sparse_matrix(dense_matrix: np.ndarray) -> tuple:
-    """Converts a given dense matrix connectivity to a sparse matrix format
-    where the locations of non fill-value entries are stored using COO
-    (coordinate list) standard. It is represented by three arrays: row indices,
-    column indices, and non-filled element flags.
+def _build_face_node_csr(face_nodes):
+    """Converts a dense ``face_node_connectivity``, padded with
+    ``INT_FILL_VALUE``, into a compressed sparse row (CSR) layout, where the
+    nodes of face ``i`` are given by ``indices[indptr[i]:indptr[i + 1]]``.
+
     Parameters
     ----------
-    dense_matrix : np.ndarray
-        The dense matrix to be converted.
+    face_nodes : np.ndarray
+        Face node connectivity of shape [n_face, n_max_face_nodes]
+
     Returns
     -------
-    tuple
-        A tuple containing three arrays:
-        - face_indices : np.ndarray
-            Array containing the face indices for each non fill-value element.
-        - node_indices : np.ndarray
-            Array containing the node indices for each non fill-value element.
-        - non_filled_elements_flag : np.ndarray
-            Array containing flags indicating if a non fill-value element is present in the corresponding row and column
-            index.
-    Example
-    -------
-    >>> face_nodes_conn = np.array([[3, 4, 5, INT_FILL_VALUE],
-    ...                             [3, 0, 2, 5],
-    ...                             [3, 4, 1, 0],
-    ...                             [0, 1, 2, -999]])
-    >>> face_indices, nodes_indices, non_filled_flag = _face_nodes_to_sparse_matrix(face_nodes_conn)
-    >>> face_indices = np.array([0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3])
-    >>> nodes_indices = np.array([3, 4, 5, 3, 0, 2, 5, 3, 4, 1, 0, 0, 1, 2])
-    >>> non_filled_flag = np.array([1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1])
+    indptr : np.ndarray
+        Array of shape [n_face + 1] containing the offset of each face into ``indices``
+    indices : np.ndarray
+        Node indices of every face, without any fill values
     """
-    n_rows, n_cols = dense_matrix.shape
-    flattened_matrix = dense_matrix.ravel()
-    valid_node_mask = flattened_matrix != INT_FILL_VALUE
-    face_indices = np.repeat(np.arange(n_rows), n_cols)[valid_node_mask]
-    node_indices = flattened_matrix[valid_node_mask]
-    non_filled_element_flags = np.ones(len(node_indices))
-    return face_indices, node_indices, non_filled_element_flags
+    face_nodes = np.asarray(face_nodes)
+    valid = face_nodes != INT_FILL_VALUE
+
+    indptr = np.zeros(face_nodes.shape[0] + 1, dtype=INT_DTYPE)
+    np.cumsum(valid.sum(axis=1), out=indptr[1:])
+
+    indices = face_nodes[valid].astype(INT_DTYPE, copy=False)
+
+    return indptr, indices
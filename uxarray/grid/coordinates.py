@@ -112,12 +112,19 @@ def normalize_in_place(node):
 
 
 def _get_xyz_from_lonlat(node_lon, node_lat):
+    """Vectorized version of ``node_lonlat_rad_to_xyz``, converting arrays of
+    longitude and latitude in degrees to normalized Cartesian (x, y, z)
+    arrays."""
     nodes_lon_rad = np.deg2rad(node_lon)
     nodes_lat_rad = np.deg2rad(node_lat)
-    nodes_rad = np.stack((nodes_lon_rad, nodes_lat_rad), axis=1)
-    nodes_cart = np.asarray(list(map(node_lonlat_rad_to_xyz, list(nodes_rad))))
 
-    return nodes_cart[:, 0], nodes_cart[:, 1], nodes_cart[:, 2]
+    cos_lat = np.cos(nodes_lat_rad)
+
+    return (
+        np.cos(nodes_lon_rad) * cos_lat,
+        np.sin(nodes_lon_rad) * cos_lat,
+        np.sin(nodes_lat_rad),
+    )
 
 
 def _populate_cartesian_xyz_coord(grid):
@@ -162,11 +169,27 @@ def _populate_cartesian_xyz_coord(grid):
 
 
 def _get_lonlat_from_xyz(x, y, z):
-    nodes_cart = np.stack((x, y, z), axis=1).tolist()
-    nodes_rad = list(map(node_xyz_to_lonlat_rad, nodes_cart))
-    nodes_degree = np.rad2deg(nodes_rad)
-
-    return nodes_degree[:, 0], nodes_degree[:, 1]
+    """Vectorized version of ``node_xyz_to_lonlat_rad``, converting arrays of
+    Cartesian (x, y, z) coordinates to longitude and latitude in degrees."""
+    x, y, z = (np.asarray(arr, dtype=np.float64) for arr in (x, y, z))
+
+    # project onto the unit sphere
+    norm = np.sqrt(x * x + y * y + z * z)
+    dx, dy, dz = x / norm, y / norm, z / norm
+    dx = dx / np.absolute(dx * dx + dy * dy + dz * dz)
+    dy = dy / np.absolute(dx * dx + dy * dy + dz * dz)
+    dz = dz / np.absolute(dx * dx + dy * dy + dz * dz)
+
+    lon_rad = np.arctan2(dy, dx)
+    lon_rad[lon_rad < 0.0] += 2.0 * np.pi
+    lat_rad = np.arcsin(np.clip(dz, -1.0, 1.0))
+
+    # nodes at the poles
+    pole = np.absolute(dz) >= (1.0 - ERROR_TOLERANCE)
+    lon_rad[pole] = 0.0
+    lat_rad[pole] = np.where(dz[pole] > 0.0, 0.5 * np.pi, -0.5 * np.pi)
+
+    return np.rad2deg(lon_rad), np.rad2deg(lat_rad)
 
 
 def _populate_lonlat_coord(grid):
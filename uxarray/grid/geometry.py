@@ -1,5 +1,10 @@
 import numpy as np
-from uxarray.constants import INT_DTYPE, ERROR_TOLERANCE, INT_FILL_VALUE
+from uxarray.constants import (
+    INT_DTYPE,
+    ERROR_TOLERANCE,
+    INT_FILL_VALUE,
+    ENABLE_JIT_CACHE,
+)
 from uxarray.grid.intersections import gca_gca_intersection
 from uxarray.grid.arcs import extreme_gca_latitude, point_within_gca
 from uxarray.grid.utils import (
@@ -22,31 +27,27 @@ REFERENCE_POINT_EQUATOR = np.array([1.0, 0.0, 0.0])
 
 # General Helpers for Polygon Viz
 # ----------------------------------------------------------------------------------------------------------------------
-@njit
-def _pad_closed_face_nodes(
-    face_node_connectivity, n_face, n_max_face_nodes, n_nodes_per_face
+@njit(cache=ENABLE_JIT_CACHE)
+def _fill_polygon_shells(
+    node_lon, node_lat, face_node_connectivity, n_nodes_per_face, polygon_shells
 ):
-    """Pads a closed array of face nodes by inserting the first element at any
-    point a fill value is encountered.
+    """Fills a pre-allocated array of polygon shells with the (lon, lat) of
+    each face's nodes, closing each shell by repeating the first node at any
+    point a fill value would be encountered.
 
     Ensures each resulting polygon has the same number of vertices.
     """
+    for face_idx in range(face_node_connectivity.shape[0]):
+        n_nodes = n_nodes_per_face[face_idx]
 
-    closed = np.ones((n_face, n_max_face_nodes + 1), dtype=INT_DTYPE)
-
-    # set final value to the original
-    closed[:, :-1] = face_node_connectivity.copy()
-
-    # if face_node_connectivity.shape[0] == 1:
-    #     closed[0, int(n_nodes_per_face):] = closed[0, 0]
-    # else:
-    #     for i, final_node_idx in enumerate(n_nodes_per_face):
-    #         closed[i, final_node_idx:] = closed[i, 0]
+        for i in range(n_nodes):
+            node_idx = face_node_connectivity[face_idx, i]
+            polygon_shells[face_idx, i, 0] = node_lon[node_idx]
+            polygon_shells[face_idx, i, 1] = node_lat[node_idx]
 
-    for i, final_node_idx in enumerate(n_nodes_per_face):
-        closed[i, final_node_idx:] = closed[i, 0]
-
-    return closed
+        for i in range(n_nodes, polygon_shells.shape[1]):
+            polygon_shells[face_idx, i, 0] = polygon_shells[face_idx, 0, 0]
+            polygon_shells[face_idx, i, 1] = polygon_shells[face_idx, 0, 1]
 
 
 def _build_polygon_shells(
@@ -59,16 +60,14 @@ def _build_polygon_shells(
 ):
     """Builds an array of polygon shells, which can be used with Shapely to
     construct polygons."""
-    closed_face_nodes = _pad_closed_face_nodes(
-        face_node_connectivity, n_face, n_max_face_nodes, n_nodes_per_face
-    )
-
-    polygon_shells = (
-        np.array(
-            [node_lon[closed_face_nodes], node_lat[closed_face_nodes]], dtype=np.float32
-        )
-        .swapaxes(0, 1)
-        .swapaxes(1, 2)
+    polygon_shells = np.empty((n_face, n_max_face_nodes + 1, 2), dtype=np.float32)
+
+    _fill_polygon_shells(
+        np.ascontiguousarray(node_lon),
+        np.ascontiguousarray(node_lat),
+        np.ascontiguousarray(face_node_connectivity),
+        np.ascontiguousarray(n_nodes_per_face),
+        polygon_shells,
     )
 
     return polygon_shells
@@ -220,8 +219,9 @@ def _build_corrected_polygon_shells(polygon_shells):
 
     Returns
     -------
-    corrected_polygon_shells : np.ndarray
-        Array containing polygon shells, with antimeridian polygons split
+    corrected_polygon_shells : np.ndarray or list
+        Polygon shells, with antimeridian polygons split. The original array of shells is returned if no
+        polygons need to be split
     _corrected_shells_to_original_faces : np.ndarray
         Original indices used to map the corrected polygon shells to their entries in face nodes
     """
@@ -230,43 +230,52 @@ def _build_corrected_polygon_shells(polygon_shells):
     import antimeridian
     from shapely import Polygon
 
-    # list of shapely Polygons representing each Face in our grid
-    polygons = [Polygon(shell) for shell in polygon_shells]
+    # only faces that cross the antimeridian need to be split
+    antimeridian_face_indices = _build_antimeridian_face_indices(
+        polygon_shells[:, :, 0]
+    )
 
-    # List of Polygons (non-split) and MultiPolygons (split across antimeridian)
-    corrected_polygons = [
-        antimeridian.fix_polygon(P, fix_winding=False) for P in polygons
-    ]
+    if len(antimeridian_face_indices) == 0:
+        # no faces are split, so the shells can be used directly
+        return polygon_shells, np.arange(len(polygon_shells), dtype=INT_DTYPE)
 
-    _corrected_shells_to_original_faces = []
     corrected_polygon_shells = []
+    n_shells_per_face = np.ones(len(polygon_shells), dtype=INT_DTYPE)
+
+    start = 0
+    for i in antimeridian_face_indices:
+        # shells of the faces before this one are unchanged
+        corrected_polygon_shells.extend(polygon_shells[start:i])
+        start = i + 1
+
+        # Polygon (non-split) or MultiPolygon (split across antimeridian)
+        polygon = antimeridian.fix_polygon(
+            Polygon(polygon_shells[i]), fix_winding=False
+        )
 
-    for i, polygon in enumerate(corrected_polygons):
         # Convert MultiPolygons into individual Polygon Vertices
         if polygon.geom_type == "MultiPolygon":
-            for individual_polygon in polygon.geoms:
-                corrected_polygon_shells.append(
-                    np.array(
-                        [
-                            individual_polygon.exterior.coords.xy[0],
-                            individual_polygon.exterior.coords.xy[1],
-                        ]
-                    ).T
-                )
-                _corrected_shells_to_original_faces.append(i)
-
-        # Convert Shapely Polygon into Polygon Vertices
+            individual_polygons = polygon.geoms
         else:
+            individual_polygons = [polygon]
+
+        for individual_polygon in individual_polygons:
             corrected_polygon_shells.append(
                 np.array(
-                    [polygon.exterior.coords.xy[0], polygon.exterior.coords.xy[1]]
+                    [
+                        individual_polygon.exterior.coords.xy[0],
+                        individual_polygon.exterior.coords.xy[1],
+                    ]
                 ).T
             )
-            _corrected_shells_to_original_faces.append(i)
 
-    # original_to_corrected = np.array(
-    #     _corrected_shells_to_original_faces, dtype=INT_DTYPE
-    # )
+        n_shells_per_face[i] = len(individual_polygons)
+
+    corrected_polygon_shells.extend(polygon_shells[start:])
+
+    _corrected_shells_to_original_faces = np.repeat(
+        np.arange(len(polygon_shells), dtype=INT_DTYPE), n_shells_per_face
+    )
 
     return corrected_polygon_shells, _corrected_shells_to_original_faces
 
@@ -9,19 +9,11 @@ from typing import (
 )
 
 
-# reader and writer imports
-from uxarray.io._exodus import _read_exodus, _encode_exodus
-from uxarray.io._mpas import _read_mpas
-from uxarray.io._ugrid import (
-    _read_ugrid,
-    _encode_ugrid,
-    _validate_minimum_ugrid,
-)
-from uxarray.io._scrip import _read_scrip, _encode_scrip
-from uxarray.io._esmf import _read_esmf
-from uxarray.io._vertices import _read_face_vertices
-from uxarray.io._topology import _read_topology
+from uxarray.constants import INT_FILL_VALUE
+from uxarray.conventions import ugrid
 
+# format specific readers and writers are imported on demand
+from uxarray.io._ugrid import _validate_minimum_ugrid
 from uxarray.io.utils import _parse_grid_type
 from uxarray.grid.area import get_all_face_area_from_coords
 from uxarray.grid.coordinates import (
@@ -37,6 +29,8 @@ from uxarray.grid.connectivity import (
     _populate_n_nodes_per_face,
     _populate_node_face_connectivity,
     _populate_edge_face_connectivity,
+    _build_index_map,
+    _remap_connectivity,
 )
 
 from uxarray.grid.geometry import (
@@ -47,6 +41,8 @@ from uxarray.grid.geometry import (
     _populate_bounds,
 )
 
+from uxarray.grid.utils import _get_morton_order
+
 from uxarray.grid.neighbors import (
     BallTree,
     KDTree,
@@ -189,14 +185,24 @@ class Grid:
 
             source_grid_spec = _parse_grid_type(dataset)
             if source_grid_spec == "Exodus":
+                from uxarray.io._exodus import _read_exodus
+
                 grid_ds, source_dims_dict = _read_exodus(dataset)
             elif source_grid_spec == "Scrip":
+                from uxarray.io._scrip import _read_scrip
+
                 grid_ds, source_dims_dict = _read_scrip(dataset)
             elif source_grid_spec == "UGRID":
+                from uxarray.io._ugrid import _read_ugrid
+
                 grid_ds, source_dims_dict = _read_ugrid(dataset)
             elif source_grid_spec == "MPAS":
+                from uxarray.io._mpas import _read_mpas
+
                 grid_ds, source_dims_dict = _read_mpas(dataset, use_dual=use_dual)
             elif source_grid_spec == "ESMF":
+                from uxarray.io._esmf import _read_esmf
+
                 grid_ds, source_dims_dict = _read_esmf(dataset)
             elif source_grid_spec == "Shapefile":
                 raise ValueError("Shapefiles not yet supported")
@@ -251,6 +257,8 @@ class Grid:
         >>> uxgrid = ux.Grid.from_ugrid(node_lon, node_lat, face_node_connectivity, fill_value)
         """
 
+        from uxarray.io._topology import _read_topology
+
         if dims_dict is None:
             dims_dict = {}
 
@@ -283,13 +291,16 @@ class Grid:
         if not isinstance(face_vertices, (list, tuple, np.ndarray)):
             raise ValueError("Input must be either a list, tuple, or np.ndarray")
 
+        from uxarray.io._vertices import _read_face_vertices
+
         face_vertices = np.asarray(face_vertices)
 
         if face_vertices.ndim == 3:
             grid_ds = _read_face_vertices(face_vertices, latlon)
 
         elif face_vertices.ndim == 2:
-            grid_ds = _read_face_vertices(np.array([face_vertices]), latlon)
+            # add a leading face dimension without copying the vertices
+            grid_ds = _read_face_vertices(face_vertices[np.newaxis], latlon)
 
         else:
             raise RuntimeError(
@@ -1009,12 +1020,18 @@ class Grid:
         )
 
         if grid_type == "UGRID":
+            from uxarray.io._ugrid import _encode_ugrid
+
             out_ds = _encode_ugrid(self._ds)
 
         elif grid_type == "Exodus":
+            from uxarray.io._exodus import _encode_exodus
+
             out_ds = _encode_exodus(self._ds)
 
         elif grid_type == "SCRIP":
+            from uxarray.io._scrip import _encode_scrip
+
             out_ds = _encode_scrip(
                 self.face_node_connectivity,
                 self.node_lon,
@@ -1150,12 +1167,18 @@ class Grid:
         """
 
         if grid_format == "ugrid":
+            from uxarray.io._ugrid import _encode_ugrid
+
             out_ds = _encode_ugrid(self._ds)
 
         elif grid_format == "exodus":
+            from uxarray.io._exodus import _encode_exodus
+
             out_ds = _encode_exodus(self._ds)
 
         elif grid_format == "scrip":
+            from uxarray.io._scrip import _encode_scrip
+
             out_ds = _encode_scrip(
                 self.face_node_connectivity,
                 self.node_lon,
@@ -1239,7 +1262,7 @@ class Grid:
         -------
         polycollection : matplotlib.collections.PolyCollection
             The output `PolyCollection` containing faces represented as polygons
-        corrected_to_original_faces: list
+        corrected_to_original_faces: np.ndarray
             Original indices used to map the corrected polygon shells to their entries in face nodes
         """
 
@@ -1290,6 +1313,57 @@ class Grid:
 
         return line_collection
 
+    def _morton_reorder(self):
+        """Returns a new grid with its nodes and faces sorted along a Morton
+        (Z-order) curve, so that elements that are close in space are also
+        close in memory, improving locality when gathering node coordinates for
+        each face.
+
+        Since the index of each element changes, the original indices are stored
+        in ``original_node_indices`` and ``original_face_indices``, which can be
+        used to reorder any associated data or restore the original ordering.
+        Connectivity and variables that depend on edges are dropped and
+        reconstructed when needed.
+
+        This method is internal-only and is not called by any public API, so
+        grids keep the element ordering of their source file unless reordered
+        explicitly.
+        """
+        node_indices = _get_morton_order(self.node_lon.values, self.node_lat.values)
+        node_index_map = _build_index_map(node_indices, self.n_node)
+
+        face_nodes = _remap_connectivity(
+            self.face_node_connectivity.values, node_index_map
+        )
+
+        # order faces by the earliest of their nodes along the curve
+        face_indices = np.argsort(
+            np.where(face_nodes != INT_FILL_VALUE, face_nodes, self.n_node).min(axis=1),
+            kind="stable",
+        )
+
+        ds = self._ds.isel(n_node=node_indices, n_face=face_indices)
+
+        # drop any variable that would require re-computation
+        ds = ds.drop_vars(
+            [
+                name
+                for name in ds.variables
+                if ("_connectivity" in name and name != "face_node_connectivity")
+                or ugrid.EDGE_DIM in ds[name].dims
+            ]
+        )
+
+        ds["face_node_connectivity"] = xr.DataArray(
+            face_nodes[face_indices],
+            dims=self.face_node_connectivity.dims,
+            attrs=self.face_node_connectivity.attrs,
+        )
+        ds["original_node_indices"] = xr.DataArray(node_indices, dims=[ugrid.NODE_DIM])
+        ds["original_face_indices"] = xr.DataArray(face_indices, dims=[ugrid.FACE_DIM])
+
+        return Grid(ds, self.source_grid_spec, self._source_dims_dict)
+
     def isel(self, **dim_kwargs):
         """Indexes an unstructured grid along a given dimension (``n_node``,
         ``n_edge``, or ``n_face``) and returns a new grid.
@@ -3,6 +3,7 @@ from __future__ import annotations
 import numpy as np
 import xarray as xr
 from uxarray.constants import INT_FILL_VALUE, INT_DTYPE
+from uxarray.grid.connectivity import _build_index_map, _remap_connectivity
 
 from typing import TYPE_CHECKING
 
@@ -110,10 +111,7 @@ def _slice_face_indices(grid, indices, inclusive=True):
     ds["subgrid_edge_indices"] = xr.DataArray(edge_indices, dims=["n_edge"])
 
     # mapping to update existing connectivity
-    node_indices_dict = {
-        key: val for key, val in zip(node_indices, np.arange(0, len(node_indices)))
-    }
-    node_indices_dict[INT_FILL_VALUE] = INT_FILL_VALUE
+    node_index_map = _build_index_map(node_indices, grid.n_node)
 
     for conn_name in grid._ds.data_vars:
         # update or drop connectivity variables to correctly point to the new index of each element
@@ -121,9 +119,7 @@ def _slice_face_indices(grid, indices, inclusive=True):
         if "_node_connectivity" in conn_name:
             # update connectivity vars that index into nodes
             ds[conn_name] = xr.DataArray(
-                np.vectorize(node_indices_dict.__getitem__, otypes=[INT_DTYPE])(
-                    ds[conn_name].values
-                ),
+                _remap_connectivity(ds[conn_name].values, node_index_map),
                 dims=ds[conn_name].dims,
             )
 
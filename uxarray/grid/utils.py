@@ -309,3 +309,46 @@ def _get_lonlat_rad_face_edge_nodes(
     )
 
     return lonlat_coordinates
+
+
+def _spread_bits_16(v):
+    """Spreads the lower 16 bits of each value so that there is a zero bit
+    between each of the original bits."""
+    v = v.astype(np.uint32)
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    v = (v | (v << 1)) & 0x55555555
+    return v
+
+
+def _get_morton_order(lon, lat):
+    """Returns the permutation that sorts points along a Morton (Z-order)
+    curve, placing points that are close in (lon, lat) close together in
+    memory.
+
+    Parameters
+    ----------
+    lon : np.ndarray
+        Longitude of each point
+    lat : np.ndarray
+        Latitude of each point
+
+    Returns
+    -------
+    order : np.ndarray
+        Indices that sort the points along the Morton curve
+    """
+
+    def _quantize(v):
+        # scale to the full range of a 16-bit integer
+        v_min, v_range = v.min(), np.ptp(v)
+        if v_range == 0:
+            return np.zeros(v.shape, dtype=np.uint16)
+        return ((v - v_min) / v_range * 65535).astype(np.uint16)
+
+    codes = _spread_bits_16(_quantize(np.asarray(lon))) | (
+        _spread_bits_16(_quantize(np.asarray(lat))) << 1
+    )
+
+    return np.argsort(codes, kind="stable")
@@ -0,0 +1,172 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+
+import numpy as np
+import xarray as xr
+
+from pathlib import Path
+
+
+def _cache_dir():
+    """Returns the root directory used for caching grid information, which can
+    be overridden with the ``UXARRAY_CACHE_DIR`` environment variable."""
+    cache_dir = os.environ.get("UXARRAY_CACHE_DIR")
+    if cache_dir is None:
+        cache_dir = Path("~/.cache/uxarray").expanduser()
+    return Path(cache_dir)
+
+
+def _file_key(filepath, *extra):
+    """Constructs a key that uniquely identifies the current state of a file
+    on disk using its resolved path, modification time, and size.
+
+    Returns ``None`` if ``filepath`` is not an existing local file (i.e. a
+    URL or in-memory object).
+    """
+    if not isinstance(filepath, (str, os.PathLike)) or not os.path.isfile(filepath):
+        return None
+
+    stat = os.stat(filepath)
+    return (str(Path(filepath).resolve()), stat.st_mtime_ns, stat.st_size) + extra
+
+
+def _json_default(value):
+    """Converts NumPy scalars and arrays stored in attributes into JSON
+    serializable types."""
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value)} is not JSON serializable")
+
+
+def _key_digest(key):
+    """Hashes a file key into a string that can be used as a file name or JSON
+    key."""
+    return hashlib.sha1(repr(key).encode()).hexdigest()
+
+
+def _memmap_cache_path(key):
+    """Directory containing the cached ``.npy`` arrays for a given file key.
+
+    Entries are grouped by the file's resolved path, so that entries for
+    previous states of the same file can be found and removed.
+    """
+    return _cache_dir() / "grids" / _key_digest(key[0]) / _key_digest(key)
+
+
+def _read_memmap_grid(key):
+    """Reconstructs a UGRID-encoded ``xr.Dataset`` from a previously cached
+    grid, with each variable backed by a memory-mapped ``.npy`` file.
+
+    Returns
+    -------
+    grid_ds : xr.Dataset or None
+        Memory-mapped dataset, or ``None`` if no valid cache entry exists
+    source_grid_spec : str
+        Source grid specification of the cached grid
+    source_dims_dict : dict
+        Mapping of source dimensions to their UGRID equivalent
+    """
+    cache_path = _memmap_cache_path(key)
+    index_path = cache_path / "index.json"
+
+    if not index_path.is_file():
+        return None, None, None
+
+    # a corrupt or incompatible entry is treated as a cache miss, so that the grid is
+    # read from its source file instead
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+
+        # arrays are opened copy-on-write, so in-place operations never modify the cache
+        data_vars, coords = {}, {}
+        for name, entry in index["variables"].items():
+            # scalars (i.e. grid_topology) can't be memory-mapped and are read directly
+            mmap_mode = "c" if entry["dims"] else None
+            var = xr.Variable(
+                entry["dims"],
+                np.load(cache_path / entry["file"], mmap_mode=mmap_mode),
+                attrs=entry["attrs"],
+            )
+            if entry["coord"]:
+                coords[name] = var
+            else:
+                data_vars[name] = var
+
+        grid_ds = xr.Dataset(data_vars, coords=coords, attrs=index["attrs"])
+
+        return grid_ds, index["source_grid_spec"], index["source_dims_dict"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, None, None
+
+
+def _write_memmap_grid(key, grid_ds, source_grid_spec, source_dims_dict):
+    """Stores each variable of a UGRID-encoded ``xr.Dataset`` as a ``.npy``
+    file, along with an index describing its dimensions and attributes.
+
+    Grids containing variables that cannot be memory-mapped (i.e. object
+    arrays) are not cached.
+    """
+    variables = {}
+    arrays = {}
+    for i, (name, var) in enumerate(grid_ds.variables.items()):
+        arr = np.asarray(var.values)
+        if arr.dtype.hasobject:
+            return False
+        arrays[f"{i}.npy"] = arr
+        variables[name] = {
+            "file": f"{i}.npy",
+            "dims": list(var.dims),
+            "attrs": dict(var.attrs),
+            "coord": name in grid_ds.coords,
+        }
+
+    index = {
+        "source_grid_spec": source_grid_spec,
+        "source_dims_dict": {str(k): str(v) for k, v in source_dims_dict.items()},
+        "attrs": dict(grid_ds.attrs),
+        "variables": variables,
+    }
+
+    try:
+        index_str = json.dumps(index, default=_json_default)
+    except TypeError:
+        return False
+
+    cache_path = _memmap_cache_path(key)
+    tmp_path = None
+
+    # the entry is written to a temporary directory and moved into place, so that a
+    # partially written entry is never read. Failures (i.e. a read-only cache directory)
+    # are ignored, since the cache only avoids re-reading the grid
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = tempfile.mkdtemp(
+            prefix=f".{cache_path.name}.", dir=cache_path.parent
+        )
+
+        for filename, arr in arrays.items():
+            np.save(os.path.join(tmp_path, filename), arr, allow_pickle=False)
+
+        with open(os.path.join(tmp_path, "index.json"), "w") as f:
+            f.write(index_str)
+
+        # an existing (i.e. corrupt) entry for the same key can't be replaced in one step
+        shutil.rmtree(cache_path, ignore_errors=True)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path is not None:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        return False
+
+    # each entry is a full copy of the grid, so entries written for a previous state of
+    # the file (or another version of uxarray) are removed. Temporary directories of
+    # concurrent writers are prefixed with a "." and left in place
+    for entry in cache_path.parent.iterdir():
+        if entry != cache_path and not entry.name.startswith("."):
+            shutil.rmtree(entry, ignore_errors=True)
+
+    return True
@@ -174,7 +174,7 @@ def _encode_exodus(ds, outfile=None):
     ux_exodus_version = 1.0
     qa_records = [["uxarray"], [ux_exodus_version], [date], [time]]
     exo_ds["qa_records"] = xr.DataArray(
-        data=xr.DataArray(np.array(qa_records, dtype="str")),
+        data=np.array(qa_records, dtype="str"),
         dims=["four", "num_qa_rec"],
     )
 
@@ -182,15 +182,10 @@ def _encode_exodus(ds, outfile=None):
     # Note: Don't get orig dimension from Mesh2 attribute topology dimension
     if "node_x" not in ds:
         x, y, z = _get_xyz_from_lonlat(ds["node_lon"].values, ds["node_lat"].values)
-        c_data = xr.DataArray([x, y, z])
     else:
-        c_data = xr.DataArray(
-            [
-                ds["node_x"].data.tolist(),
-                ds["node_y"].data.tolist(),
-                ds["node_z"].data.tolist(),
-            ]
-        )
+        x, y, z = ds["node_x"].values, ds["node_y"].values, ds["node_z"].values
+
+    c_data = np.array([x, y, z], dtype=np.float64)
 
     exo_ds["coord"] = xr.DataArray(data=c_data, dims=["num_dim", "num_nodes"])
 
@@ -256,14 +251,14 @@ def _encode_exodus(ds, outfile=None):
         conn_blk = conn_nofill[start : start + num_faces]
         conn_np = np.array([np.array(xi, dtype=INT_DTYPE) for xi in conn_blk])
         exo_ds[str_connect] = xr.DataArray(
-            data=xr.DataArray((conn_np[:] + 1)),
+            data=conn_np + 1,
             dims=[str_el_in_blk, str_nod_per_el],
             attrs={"elem_type": element_type},
         )
 
         # edge type
         exo_ds[str_edge_type] = xr.DataArray(
-            data=xr.DataArray(np.zeros((num_faces, num_nodes), dtype=INT_DTYPE)),
+            data=np.zeros((num_faces, num_nodes), dtype=INT_DTYPE),
             dims=[str_el_in_blk, str_nod_per_el],
         )
 
@@ -275,7 +270,7 @@ def _encode_exodus(ds, outfile=None):
         # TODO: fix num attr
         num_attr = 1
         exo_ds[str_attrib] = xr.DataArray(
-            data=xr.DataArray(np.zeros((num_faces, num_attr), float)),
+            data=np.zeros((num_faces, num_attr), float),
             dims=[str_el_in_blk, str_att_in_blk],
         )
 
@@ -290,16 +285,16 @@ def _encode_exodus(ds, outfile=None):
     )
     # eb_status
     exo_ds["eb_status"] = xr.DataArray(
-        data=xr.DataArray(np.ones([num_blks], dtype=INT_DTYPE)), dims=["num_el_blk"]
+        data=np.ones([num_blks], dtype=INT_DTYPE), dims=["num_el_blk"]
     )
 
     # eb_names
     eb_names = np.empty(num_blks, dtype="str")
-    exo_ds["eb_names"] = xr.DataArray(data=xr.DataArray(eb_names), dims=["num_el_blk"])
+    exo_ds["eb_names"] = xr.DataArray(data=eb_names, dims=["num_el_blk"])
     cnames = ["x", "y", "z"]
 
     exo_ds["coor_names"] = xr.DataArray(
-        data=xr.DataArray(np.array(cnames, dtype="str")), dims=["num_dim"]
+        data=np.array(cnames, dtype="str"), dims=["num_dim"]
     )
 
     return exo_ds
@@ -11,41 +11,53 @@ def _read_ugrid(ds):
     """Parses an unstructured grid dataset and encodes it in the UGRID
     conventions."""
 
+    # name of the first data variable with each cf_role, built in a single pass instead of
+    # filtering the dataset for each role
+    cf_role_names = {}
+    for name, var in ds.data_vars.items():
+        cf_role_names.setdefault(var.attrs.get("cf_role"), name)
+
     # Grid Topology
-    grid_topology_name = list(ds.filter_by_attrs(cf_role="mesh_topology").keys())[0]
+    grid_topology_name = cf_role_names["mesh_topology"]
     ds = ds.rename({grid_topology_name: "grid_topology"})
 
     # Coordinates
 
+    # topology attributes are looked up directly, avoiding xarray's attribute access fallback
+    topology_attrs = ds["grid_topology"].attrs
+
     # get the names of node_lon and node_lat
-    node_lon_name, node_lat_name = ds["grid_topology"].node_coordinates.split()
+    node_lon_name, node_lat_name = topology_attrs["node_coordinates"].split()
     coord_dict = {
         node_lon_name: ugrid.NODE_COORDINATES[0],
         node_lat_name: ugrid.NODE_COORDINATES[1],
     }
 
-    if "edge_coordinates" in ds["grid_topology"]:
+    if "edge_coordinates" in topology_attrs:
         # get the names of edge_lon and edge_lat, if they exist
-        edge_lon_name, edge_lat_name = ds["grid_topology"].edge_coordinates.split()
+        edge_lon_name, edge_lat_name = topology_attrs["edge_coordinates"].split()
         coord_dict[edge_lon_name] = ugrid.EDGE_COORDINATES[0]
         coord_dict[edge_lat_name] = ugrid.EDGE_COORDINATES[1]
 
-    if "face_coordinates" in ds["grid_topology"]:
+    if "face_coordinates" in topology_attrs:
         # get the names of face_lon and face_lat, if they exist
-        face_lon_name, face_lat_name = ds["grid_topology"].edge_coordinates.split()
+        face_lon_name, face_lat_name = topology_attrs["face_coordinates"].split()
         coord_dict[face_lon_name] = ugrid.FACE_COORDINATES[0]
         coord_dict[face_lat_name] = ugrid.FACE_COORDINATES[1]
 
+    # only rename coordinates that are present in the dataset
+    coord_dict = {name: value for name, value in coord_dict.items() if name in ds}
+
     ds = ds.rename(coord_dict)
     # Connectivity
 
     conn_dict = {}
     for conn_name in ugrid.CONNECTIVITY_NAMES:
-        if conn_name in ds.grid_topology.attrs:
-            orig_conn_name = ds.grid_topology.attrs[conn_name]
+        if conn_name in topology_attrs:
+            orig_conn_name = topology_attrs[conn_name]
             conn_dict[orig_conn_name] = conn_name
-        elif len(ds.filter_by_attrs(cf_role=conn_name).keys()):
-            orig_conn_name = list(ds.filter_by_attrs(cf_role=conn_name).keys())[0]
+        elif conn_name in cf_role_names:
+            orig_conn_name = cf_role_names[conn_name]
             conn_dict[orig_conn_name] = conn_name
 
     ds = ds.rename(conn_dict)
@@ -53,25 +65,40 @@ def _read_ugrid(ds):
     for conn_name in conn_dict.values():
         ds = _standardize_connectivity(ds, conn_name)
 
-    dim_dict = {}
-
-    # Rename Core Dims (node, edge, face)
-    if "node_dimension" in ds["grid_topology"]:
-        dim_dict[ds["grid_topology"].node_dimension] = ugrid.NODE_DIM
-    else:
-        dim_dict[ds["node_lon"].dims[0]] = ugrid.NODE_DIM
+    # the UGRID conventions allow connectivity variables to be stored with the element dimension last
+    element_dims = [
+        topology_attrs[dim]
+        for dim in ["node_dimension", "edge_dimension", "face_dimension"]
+        if topology_attrs.get(dim) in ds.dims
+    ]
+    transposed_conn = {
+        conn_name: ds[conn_name].transpose()
+        for conn_name in conn_dict.values()
+        if ds[conn_name].ndim == 2 and ds[conn_name].dims[1] in element_dims
+    }
+    if transposed_conn:
+        ds = ds.assign(transposed_conn)
 
-    if "face_dimension" in ds["grid_topology"]:
-        dim_dict[ds["grid_topology"].face_dimension] = ugrid.FACE_DIM
-    else:
-        dim_dict[ds["face_node_connectivity"].dims[0]] = ugrid.FACE_DIM
+    dim_dict = {}
 
-    if "edge_dimension" in ds["grid_topology"]:
+    # Rename Core Dims (node, edge, face), using the dimension names declared by the
+    # topology only if they are present in the dataset
+    node_dim = topology_attrs.get("node_dimension")
+    if node_dim not in ds.dims:
+        node_dim = ds["node_lon"].dims[0]
+    dim_dict[node_dim] = ugrid.NODE_DIM
+
+    face_dim = topology_attrs.get("face_dimension")
+    if face_dim not in ds.dims:
+        face_dim = ds["face_node_connectivity"].dims[0]
+    dim_dict[face_dim] = ugrid.FACE_DIM
+
+    edge_dim = topology_attrs.get("edge_dimension")
+    if edge_dim in ds.dims:
+        dim_dict[edge_dim] = ugrid.EDGE_DIM
+    elif "edge_lon" in ds:
         # edge dimension is not always provided
-        dim_dict[ds["grid_topology"].edge_dimension] = ugrid.EDGE_DIM
-    else:
-        if "edge_lon" in ds:
-            dim_dict[ds["edge_lon"].dims[0]] = ugrid.EDGE_DIM
+        dim_dict[ds["edge_lon"].dims[0]] = ugrid.EDGE_DIM
 
     dim_dict[ds["face_node_connectivity"].dims[1]] = ugrid.N_MAX_FACE_NODES_DIM
 
@@ -125,13 +152,15 @@ def _standardize_connectivity(ds, conn_name):
         Input Dataset with correct index variables
     """
 
+    conn_da = ds[conn_name]
+
     # original connectivity
-    conn = ds[conn_name].values
+    conn = conn_da.values
 
     # original fill value, if one exists
-    if "_FillValue" in ds[conn_name].attrs:
-        original_fv = ds[conn_name]._FillValue
-    elif np.isnan(ds[conn_name].values).any():
+    if "_FillValue" in conn_da.attrs:
+        original_fv = conn_da.attrs["_FillValue"]
+    elif np.issubdtype(conn.dtype, np.floating) and np.isnan(conn).any():
         original_fv = np.nan
     else:
         original_fv = None
@@ -146,37 +175,42 @@ def _standardize_connectivity(ds, conn_name):
             new_dtype=INT_DTYPE,
         )
 
-        if "start_index" in ds[conn_name].attrs:
-            new_conn -= INT_DTYPE(ds[conn_name].start_index)
+        if "start_index" in conn_da.attrs:
+            new_conn -= INT_DTYPE(conn_da.attrs["start_index"])
         else:
             new_conn -= INT_DTYPE(new_conn.min())
 
         # reassign data to use updated connectivity
-        ds[conn_name].data = new_conn
+        conn_da.data = new_conn
 
         # use new fill value
-        ds[conn_name].attrs["_FillValue"] = INT_FILL_VALUE
+        conn_da.attrs["_FillValue"] = INT_FILL_VALUE
 
     return ds
 
 
 def _is_ugrid(ds):
     """Check mesh topology and dimension."""
-    # getkeys_filter_by_attribute(filepath, attr_name, attr_val)
-    # return type KeysView
-    node_coords_dv = ds.filter_by_attrs(node_coordinates=lambda v: v is not None)
-    face_conn_dv = ds.filter_by_attrs(face_node_connectivity=lambda v: v is not None)
-    topo_dim_dv = ds.filter_by_attrs(topology_dimension=lambda v: v is not None)
-    mesh_topo_dv = ds.filter_by_attrs(cf_role="mesh_topology")
-    if (
-        len(mesh_topo_dv) != 0
-        and len(topo_dim_dv) != 0
-        and len(face_conn_dv) != 0
-        and len(node_coords_dv) != 0
-    ):
-        return True
-    else:
-        return False
+    # single pass over the attributes of each variable, instead of constructing a
+    # filtered dataset for each required attribute
+    has_mesh_topo = False
+    required_attrs = {
+        "node_coordinates",
+        "face_node_connectivity",
+        "topology_dimension",
+    }
+    for var in ds.variables.values():
+        for attr_name, attr_value in var.attrs.items():
+            if attr_value is None:
+                continue
+            if attr_name == "cf_role" and attr_value == "mesh_topology":
+                has_mesh_topo = True
+            required_attrs.discard(attr_name)
+
+        if has_mesh_topo and not required_attrs:
+            return True
+
+    return False
 
 
 def _validate_minimum_ugrid(grid_ds):
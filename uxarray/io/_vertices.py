@@ -23,43 +23,23 @@ def _read_face_vertices(face_vertices, latlon):
         y_units = "m"
         z_units = "m"
 
-    # x_coord = face_vertices[:, :, 0].flatten()
-    # y_coord = face_vertices[:, :, 1].flatten()
-    #
-    # if face_vertices[0][0].size > 2:
-    #     z_coord = face_vertices[:, :, 2].flatten()
-    # else:
-    #     z_coord = x_coord * 0.0
-
     # Identify unique vertices and their indices
     unique_verts, indices = np.unique(
         face_vertices.reshape(-1, face_vertices.shape[-1]), axis=0, return_inverse=True
     )
 
     # Nodes index that contain a fill value
-    fill_value_mask = np.logical_or(
-        unique_verts[:, 0] == INT_FILL_VALUE, unique_verts[:, 1] == INT_FILL_VALUE
-    )
-    if face_vertices[0][0].size > 2:
-        fill_value_mask = np.logical_or(
-            unique_verts[:, 0] == INT_FILL_VALUE,
-            unique_verts[:, 1] == INT_FILL_VALUE,
-            unique_verts[:, 2] == INT_FILL_VALUE,
-        )
-
-    # Get the indices of all the False values in fill_value_mask
-    false_indices = np.where(fill_value_mask)[0]
+    fill_value_mask = np.any(unique_verts == INT_FILL_VALUE, axis=1)
 
-    # Check if any False values were found
-    indices = indices.astype(INT_DTYPE)
-    if false_indices.size > 0:
-        # Remove the rows corresponding to False values in unique_verts
-        unique_verts = np.delete(unique_verts, false_indices, axis=0)
+    indices = indices.astype(INT_DTYPE, copy=False)
+    if fill_value_mask.any():
+        # new index of each unique vertex once fill value vertices are removed
+        new_indices = np.cumsum(~fill_value_mask, dtype=INT_DTYPE) - 1
+        new_indices[fill_value_mask] = INT_FILL_VALUE
 
-        # Update indices accordingly
-        for i, idx in enumerate(false_indices):
-            indices[indices == idx] = INT_FILL_VALUE
-            indices[(indices > idx) & (indices != INT_FILL_VALUE)] -= 1
+        # remap all indices at once and remove the fill value vertices
+        indices = new_indices[indices.ravel()]
+        unique_verts = unique_verts[~fill_value_mask]
 
     if latlon:
         grid_ds["node_lon"] = xr.DataArray(
@@ -83,13 +63,15 @@ def _read_face_vertices(face_vertices, latlon):
             )
         else:
             grid_ds["node_z"] = xr.DataArray(
-                data=unique_verts[:, 1] * 0.0, dims=["n_node"], attrs={"units": z_units}
+                data=np.zeros(len(unique_verts)),
+                dims=["n_node"],
+                attrs={"units": z_units},
             )
 
     # Create connectivity array using indices of unique vertices
     connectivity = indices.reshape(face_vertices.shape[:-1])
     grid_ds["face_node_connectivity"] = xr.DataArray(
-        data=xr.DataArray(connectivity).astype(INT_DTYPE),
+        data=connectivity,
         dims=["n_face", "n_max_face_nodes"],
         attrs={
             "cf_role": "face_node_connectivity",